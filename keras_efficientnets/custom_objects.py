@@ -80,6 +80,14 @@ class DropConnect(layers.Layer):
         self.drop_connect_rate = float(drop_connect_rate)
 
     def call(self, inputs, training=None):
+        if training is None:
+            training = K.learning_phase()
+
+        # Skip building the random mask at all when it can never be applied,
+        # either because nothing is dropped or the learning phase is fixed
+        # to inference (e.g. via `K.set_learning_phase(0)`).
+        if not self.drop_connect_rate or (isinstance(training, (bool, int)) and not training):
+            return inputs
 
         def drop_connect():
             keep_prob = 1.0 - self.drop_connect_rate
@@ -17,10 +17,15 @@
   EfficientNet: Rethinking Model Scaling for Convolutional Neural Networks.
   ICML'19, https://arxiv.org/abs/1905.11946
 """
-import os
+import contextlib
 import math
-from typing import List
+import os
+from fractions import Fraction
+from functools import lru_cache
+from typing import List, Optional
 
+import numpy as np
+import tensorflow as tf
 from keras import backend as K
 from keras import layers
 from keras.models import Model
@@ -33,6 +38,8 @@ from keras_efficientnets.config import BlockArgs, get_default_block_list
 from keras_efficientnets.custom_objects import EfficientNetConvInitializer
 from keras_efficientnets.custom_objects import EfficientNetDenseInitializer
 from keras_efficientnets.custom_objects import Swish, DropConnect
+from keras_efficientnets.inference import compile_xla, fuse_bn_for_inference
+from keras_efficientnets.inference import freeze_input_signature, xla_scope
 
 
 __all__ = ['EfficientNet',
@@ -44,169 +51,356 @@ __all__ = ['EfficientNet',
            'EfficientNetB5',
            'EfficientNetB6',
            'EfficientNetB7',
-           'preprocess_input']
+           'preprocess_input',
+           'preprocess_input_batch']
+
+
+# The initializers are stateless, so a single instance is shared by every layer.
+_CONV_INITIALIZER = EfficientNetConvInitializer()
+_DENSE_INITIALIZER = EfficientNetDenseInitializer()
+
+
+# ImageNet statistics scaled to the [0, 255] pixel range, such that
+# `(x - mean) * inv_std` matches the 'torch' mode of keras_applications.
+_MEAN_HWC = np.array([0.485, 0.456, 0.406], dtype=np.float32) * np.float32(255.)
+_INV_STD_HWC = np.float32(1.) / (np.array([0.229, 0.224, 0.225], dtype=np.float32) * np.float32(255.))
+_MEAN_CHW = _MEAN_HWC.reshape((3, 1, 1))
+_INV_STD_CHW = _INV_STD_HWC.reshape((3, 1, 1))
 
 
 def preprocess_input(x, data_format=None):
-    return _preprocess(x, data_format, mode='torch', backend=K)
+    """
+    Preprocesses an image or a batch of images, by scaling the
+    pixels to [0, 1] and normalizing each channel with the
+    ImageNet mean and standard deviation.
+
+    Numpy inputs are converted to float32 once and normalized
+    in place. Float32 arrays are therefore modified in place.
+
+    # Arguments:
+        x: A 3D (single image) or 4D (batch of images) numpy array
+            or tensor, with pixel values in the range [0, 255].
+        data_format: "channels_first" or "channels_last". If left
+            as None, defaults to the value set in ~/.keras.
+
+    # Returns:
+        The preprocessed float32 array.
+    """
+    if tf.is_tensor(x):
+        return _preprocess(x, data_format, mode='torch', backend=K)
+
+    if data_format is None:
+        data_format = K.image_data_format()
+
+    if data_format == 'channels_first':
+        mean, inv_std = _MEAN_CHW, _INV_STD_CHW
+    else:
+        mean, inv_std = _MEAN_HWC, _INV_STD_HWC
+
+    x = np.asarray(x, dtype=np.float32)
+    np.subtract(x, mean, out=x)
+    np.multiply(x, inv_std, out=x)
+    return x
+
+
+def preprocess_input_batch(x, data_format=None):
+    """
+    Preprocesses a batch of images with Tensorflow ops, in the
+    same way as `preprocess_input`.
+
+    The normalization runs on the same device as the model, so
+    raw uint8 images can be copied to the GPU directly, and XLA
+    can fuse the normalization with the stem convolution.
+
+    # Arguments:
+        x: A 4D tensor or array of images with pixel values in the
+            range [0, 255]. Integer inputs, such as decoded uint8
+            JPEG images, are cast to float32.
+        data_format: "channels_first" or "channels_last". If left
+            as None, defaults to the value set in ~/.keras.
+
+    # Returns:
+        The preprocessed tensor.
+    """
+    if data_format is None:
+        data_format = K.image_data_format()
+
+    if data_format == 'channels_first':
+        mean, inv_std = _MEAN_CHW, _INV_STD_CHW
+    else:
+        mean, inv_std = _MEAN_HWC, _INV_STD_HWC
+
+    x = tf.convert_to_tensor(x)
+    if not x.dtype.is_floating:
+        x = tf.cast(x, tf.float32)
+
+    mean = tf.constant(mean, dtype=x.dtype)
+    inv_std = tf.constant(inv_std, dtype=x.dtype)
+    return (x - mean) * inv_std
 
 
 # Obtained from https://github.com/tensorflow/tpu/blob/master/models/official/efficientnet/efficientnet_model.py
-def round_filters(filters, width_coefficient, depth_divisor, min_depth):
+@lru_cache(maxsize=None)
+def round_filters(filters: int,
+                  width_coefficient: float,
+                  depth_divisor: int,
+                  min_depth: Optional[int]) -> int:
     """Round number of filters based on depth multiplier."""
-    multiplier = float(width_coefficient)
-    divisor = int(depth_divisor)
-    min_depth = min_depth
-
-    if not multiplier:
+    if not width_coefficient:
         return filters
 
-    filters *= multiplier
+    # exact filters * width_coefficient, free of floating point error
+    scaled_filters = filters * Fraction(str(width_coefficient))
+    divisor = int(depth_divisor)
     min_depth = min_depth or divisor
-    new_filters = max(min_depth, int(filters + divisor / 2) // divisor * divisor)
+    new_filters = max(min_depth,
+                      math.floor(scaled_filters + Fraction(divisor, 2)) // divisor * divisor)
     # Make sure that round down does not go down by more than 10%.
-    if new_filters < 0.9 * filters:
+    if new_filters < Fraction(9, 10) * scaled_filters:
         new_filters += divisor
 
     return int(new_filters)
 
 
 # Obtained from https://github.com/tensorflow/tpu/blob/master/models/official/efficientnet/efficientnet_model.py
-def round_repeats(repeats, depth_coefficient):
+@lru_cache(maxsize=None)
+def round_repeats(repeats: int, depth_coefficient: float) -> int:
     """Round number of filters based on depth multiplier."""
-    multiplier = depth_coefficient
-
-    if not multiplier:
+    if not depth_coefficient:
         return repeats
 
-    return int(math.ceil(multiplier * repeats))
+    return int(math.ceil(repeats * Fraction(str(depth_coefficient))))
 
 
-# Obtained from https://github.com/tensorflow/tpu/blob/master/models/official/efficientnet/efficientnet_model.py
-def SEBlock(input_filters, se_ratio, expand_ratio, data_format=None):
-    if data_format is None:
-        data_format = K.image_data_format()
+_WEIGHTS_URL = "https://github.com/titu1994/keras-efficientnets/releases/download/v0.1/"
 
-    num_reduced_filters = max(
-        1, int(input_filters * se_ratio))
-    filters = input_filters * expand_ratio
+# Default image size -> name of the ImageNet weights file.
+# TODO: When weights for efficientnet-b6 (528) and efficientnet-b7 (600) become available,
+#           add them here and update the ValueError message in `EfficientNet`.
+_IMAGENET_WEIGHTS = {
+    224: 'efficientnet-b0',
+    240: 'efficientnet-b1',
+    260: 'efficientnet-b2',
+    300: 'efficientnet-b3',
+    380: 'efficientnet-b4',
+    456: 'efficientnet-b5',
+}
 
-    if data_format == 'channels_first':
-        channel_axis = 1
-        spatial_dims = [2, 3]
+
+def _get_imagenet_weights_path(default_size, include_top):
+    """Returns the path of the ImageNet weights, downloading them if needed."""
+    name = _IMAGENET_WEIGHTS[default_size]
+    if not include_top:
+        name += '_notop'
+
+    filename = name + '.h5'
+    return get_file(filename, _WEIGHTS_URL + filename, cache_subdir='models')
+
+
+@contextlib.contextmanager
+def _precision_scope(precision):
+    """
+    Sets the global Keras dtype policy to `precision` while the layers
+    inside the scope are built, and restores the previous policy
+    afterwards. Only tf.keras backed Keras has dtype policies, for
+    multi-backend Keras the scope does nothing.
+    """
+    if not issubclass(layers.Layer, tf.keras.layers.Layer):
+        yield
+        return
+
+    mixed_precision = tf.keras.mixed_precision
+    if hasattr(mixed_precision, 'set_global_policy'):
+        get_policy = mixed_precision.global_policy
+        set_policy = mixed_precision.set_global_policy
     else:
-        channel_axis = -1
-        spatial_dims = [1, 2]
+        get_policy = mixed_precision.experimental.global_policy
+        set_policy = mixed_precision.experimental.set_policy
 
-    def block(inputs):
-        x = inputs
-        x = layers.Lambda(lambda a: K.mean(a, axis=spatial_dims, keepdims=True))(x)
-        x = layers.Conv2D(
+    previous_policy = get_policy()
+    set_policy(precision)
+    try:
+        yield
+    finally:
+        set_policy(previous_policy)
+
+
+# Obtained from https://github.com/tensorflow/tpu/blob/master/models/official/efficientnet/efficientnet_model.py
+class SEBlock(object):
+    """
+    Squeeze and Excitation block.
+
+    The layers of the block are created once, when the block is
+    constructed. Calling the same block on several inputs shares
+    its weights.
+    """
+
+    def __init__(self, input_filters, se_ratio, expand_ratio, channel_axis):
+        num_reduced_filters = max(
+            1, int(input_filters * se_ratio))
+        filters = input_filters * expand_ratio
+
+        if channel_axis == 1:
+            data_format = 'channels_first'
+            squeeze_shape = (filters, 1, 1)
+        else:
+            data_format = 'channels_last'
+            squeeze_shape = (1, 1, filters)
+
+        # Squeeze
+        self.pool = layers.GlobalAveragePooling2D(data_format=data_format)
+        self.reshape = layers.Reshape(squeeze_shape)
+        self.reduce_conv = layers.Conv2D(
             num_reduced_filters,
             kernel_size=[1, 1],
             strides=[1, 1],
-            kernel_initializer=EfficientNetConvInitializer(),
+            kernel_initializer=_CONV_INITIALIZER,
             padding='same',
-            use_bias=True)(x)
-        x = Swish()(x)
-        # Excite
-        x = layers.Conv2D(
+            data_format=data_format,
+            use_bias=True)
+        self.reduce_activation = Swish()
+        # Excite, with the sigmoid gate applied by the conv itself
+        self.expand_conv = layers.Conv2D(
             filters,
             kernel_size=[1, 1],
             strides=[1, 1],
-            kernel_initializer=EfficientNetConvInitializer(),
+            activation='sigmoid',
+            kernel_initializer=_CONV_INITIALIZER,
             padding='same',
-            use_bias=True)(x)
-        x = layers.Activation('sigmoid')(x)
-        out = layers.Multiply()([x, inputs])
+            data_format=data_format,
+            use_bias=True)
+        self.multiply = layers.Multiply()
+
+    def __call__(self, inputs):
+        x = self.pool(inputs)
+        x = self.reshape(x)
+        x = self.reduce_conv(x)
+        x = self.reduce_activation(x)
+        x = self.expand_conv(x)
+        out = self.multiply([x, inputs])
         return out
 
-    return block
-
 
 # Obtained from https://github.com/tensorflow/tpu/blob/master/models/official/efficientnet/efficientnet_model.py
-def MBConvBlock(input_filters, output_filters,
-                kernel_size, strides,
-                expand_ratio, se_ratio,
-                id_skip, drop_connect_rate,
-                batch_norm_momentum=0.99,
-                batch_norm_epsilon=1e-3,
-                data_format=None):
+class MBConvBlock(object):
+    """
+    Mobile Inverted Residual Bottleneck block.
 
-    if data_format is None:
-        data_format = K.image_data_format()
+    The layers of the block are created once, when the block is
+    constructed. Calling the same block on several inputs shares
+    its weights.
+    """
 
-    if data_format == 'channels_first':
-        channel_axis = 1
-        spatial_dims = [2, 3]
-    else:
-        channel_axis = -1
-        spatial_dims = [1, 2]
+    def __init__(self, input_filters, output_filters,
+                 kernel_size, strides,
+                 expand_ratio, se_ratio,
+                 id_skip, drop_connect_rate,
+                 channel_axis,
+                 batch_norm_momentum=0.99,
+                 batch_norm_epsilon=1e-3,
+                 fuse_depthwise=False):
 
-    has_se = (se_ratio is not None) and (se_ratio > 0) and (se_ratio <= 1)
-    filters = input_filters * expand_ratio
+        self.fuse_depthwise = fuse_depthwise
+        has_se = (se_ratio is not None) and (se_ratio > 0) and (se_ratio <= 1)
+        filters = input_filters * expand_ratio
 
-    def block(inputs):
+        if channel_axis == 1:
+            data_format = 'channels_first'
+        else:
+            data_format = 'channels_last'
 
         if expand_ratio != 1:
-            x = layers.Conv2D(
+            self.expand_conv = layers.Conv2D(
                 filters,
                 kernel_size=[1, 1],
                 strides=[1, 1],
-                kernel_initializer=EfficientNetConvInitializer(),
+                kernel_initializer=_CONV_INITIALIZER,
                 padding='same',
-                use_bias=False)(inputs)
-            x = layers.BatchNormalization(
+                data_format=data_format,
+                use_bias=False)
+            self.expand_bn = layers.BatchNormalization(
                 axis=channel_axis,
                 momentum=batch_norm_momentum,
-                epsilon=batch_norm_epsilon)(x)
-            x = Swish()(x)
+                epsilon=batch_norm_epsilon)
+            self.expand_activation = Swish()
         else:
-            x = inputs
+            self.expand_conv = None
 
-        x = layers.DepthwiseConv2D(
+        self.depthwise_conv = layers.DepthwiseConv2D(
             [kernel_size, kernel_size],
             strides=strides,
-            depthwise_initializer=EfficientNetConvInitializer(),
+            depthwise_initializer=_CONV_INITIALIZER,
             padding='same',
-            use_bias=False)(x)
-        x = layers.BatchNormalization(
+            data_format=data_format,
+            use_bias=False)
+        self.depthwise_bn = layers.BatchNormalization(
             axis=channel_axis,
             momentum=batch_norm_momentum,
-            epsilon=batch_norm_epsilon)(x)
-        x = Swish()(x)
+            epsilon=batch_norm_epsilon)
+        self.depthwise_activation = Swish()
 
         if has_se:
-            x = SEBlock(input_filters, se_ratio, expand_ratio,
-                        data_format)(x)
+            self.se_block = SEBlock(input_filters, se_ratio, expand_ratio,
+                                    channel_axis)
+        else:
+            self.se_block = None
 
         # output phase
-
-        x = layers.Conv2D(
+        self.project_conv = layers.Conv2D(
             output_filters,
             kernel_size=[1, 1],
             strides=[1, 1],
-            kernel_initializer=EfficientNetConvInitializer(),
+            kernel_initializer=_CONV_INITIALIZER,
             padding='same',
-            use_bias=False)(x)
-        x = layers.BatchNormalization(
+            data_format=data_format,
+            use_bias=False)
+        self.project_bn = layers.BatchNormalization(
             axis=channel_axis,
             momentum=batch_norm_momentum,
-            epsilon=batch_norm_epsilon)(x)
+            epsilon=batch_norm_epsilon)
 
+        self.drop_connect = None
+        self.add = None
         if id_skip:
-            if all(s == 1 for s in strides) and (
+            if strides[0] == 1 and strides[1] == 1 and (
                     input_filters == output_filters):
 
                 # only apply drop_connect if skip presents.
                 if drop_connect_rate:
-                    x = DropConnect(drop_connect_rate)(x)
+                    self.drop_connect = DropConnect(drop_connect_rate)
 
-                x = layers.Add()([x, inputs])
+                self.add = layers.Add()
 
-        return x
+    def __call__(self, inputs):
+        if self.expand_conv is not None:
+            x = self.expand_conv(inputs)
+            x = self.expand_bn(x)
+        else:
+            x = inputs
+
+        # Compiling Swish -> Depthwise Conv -> BN -> Swish as one XLA cluster
+        # avoids writing out the expanded activation before the depthwise conv.
+        with xla_scope(self.fuse_depthwise):
+            if self.expand_conv is not None:
+                x = self.expand_activation(x)
+
+            x = self.depthwise_conv(x)
+            x = self.depthwise_bn(x)
+            x = self.depthwise_activation(x)
+
+        if self.se_block is not None:
+            x = self.se_block(x)
+
+        x = self.project_conv(x)
+        x = self.project_bn(x)
+
+        if self.add is not None:
+            if self.drop_connect is not None:
+                x = self.drop_connect(x)
+
+            x = self.add([x, inputs])
 
-    return block
+        return x
 
 
 def EfficientNet(input_shape,
@@ -226,6 +420,12 @@ def EfficientNet(input_shape,
                  min_depth=None,
                  data_format=None,
                  default_size=None,
+                 precision='float32',
+                 fuse_depthwise=False,
+                 fuse_batch_norm=False,
+                 xla_compile=False,
+                 xla_input_signature=None,
+                 predict_batch_size=None,
                  **kwargs):
     """
     Builder model for EfficientNets.
@@ -285,11 +485,42 @@ def EfficientNet(input_shape,
         data_format: "channels_first" or "channels_last". If left
             as None, defaults to the value set in ~/.keras.
         default_size: Specifies the default image size of the model
+        precision: "float32" or "mixed_float16". Mixed precision
+            computes the convolutions in float16 on Tensor Cores,
+            and requires the "channels_last" data format and Keras
+            to be backed by `tf.keras` (Keras 2.4+). The global
+            Keras dtype policy is only changed while the model is
+            built.
+        fuse_depthwise: Whether to compile the Swish activation and the
+            depthwise convolution of every MBConvBlock as a single
+            XLA cluster, which avoids materializing the expanded
+            activation. Only applies to models built in graph mode,
+            use `xla_compile` on TensorFlow 2.x instead.
+        fuse_batch_norm: Whether to fold the BatchNormalization layers
+            into the preceding convolutions after the weights are
+            loaded. The resulting model can only be used for inference.
+        xla_compile: Whether to compile the inference forward pass
+            of the model with XLA. Requires TensorFlow 2.x.
+        xla_input_signature: Optional list with a single
+            `tf.TensorSpec` to fix the input shape of the XLA
+            compiled forward pass. Only used if `xla_compile`
+            is True.
+        predict_batch_size: Optional int. If provided, an XLA compiled
+            inference function with the input shape fixed to this
+            batch size is attached to the model as `model.predict_fn`.
+            Requires TensorFlow 2.x.
 
     # Raises:
         - ValueError: If weights are not in 'imagenet' or None.
         - ValueError: If weights are 'imagenet' and `classes` is
             not 1000.
+        - ValueError: If precision is not in 'float32' or
+            'mixed_float16'.
+        - ValueError: If precision is 'mixed_float16' and the
+            data format is 'channels_first', or Keras is not backed
+            by `tf.keras`.
+        - ValueError: If `fuse_depthwise` is True while Tensorflow
+            executes eagerly.
 
     # Returns:
         A Keras Model.
@@ -304,9 +535,26 @@ def EfficientNet(input_shape,
         raise ValueError('If using `weights` as `"imagenet"` with `include_top` '
                          'as true, `classes` should be 1000')
 
+    if precision not in {'float32', 'mixed_float16'}:
+        raise ValueError('The `precision` argument should be either '
+                         '`float32` or `mixed_float16`.')
+
     if data_format is None:
         data_format = K.image_data_format()
 
+    if precision == 'mixed_float16' and not issubclass(layers.Layer, tf.keras.layers.Layer):
+        raise ValueError('Mixed precision requires Keras to be '
+                         'backed by `tf.keras` (Keras 2.4+).')
+
+    if precision == 'mixed_float16' and data_format == 'channels_first':
+        raise ValueError('Tensor Cores require the `channels_last` data format '
+                         'with `mixed_float16` precision.')
+
+    if fuse_depthwise and tf.executing_eagerly():
+        raise ValueError('`fuse_depthwise` only applies to models built in graph '
+                         'mode. Use `xla_compile` to compile the model with XLA '
+                         'on TensorFlow 2.x instead.')
+
     if data_format == 'channels_first':
         channel_axis = 1
     else:
@@ -334,212 +582,132 @@ def EfficientNet(input_shape,
                                       require_flatten=include_top,
                                       weights=weights)
 
-    # Stem part
-    if input_tensor is None:
-        inputs = layers.Input(shape=input_shape)
-    else:
-        if not K.is_keras_tensor(input_tensor):
-            inputs = layers.Input(tensor=input_tensor, shape=input_shape)
+    with _precision_scope(precision):
+        # Stem part
+        if input_tensor is None:
+            inputs = layers.Input(shape=input_shape)
         else:
-            inputs = input_tensor
-
-    x = inputs
-    x = layers.Conv2D(
-        filters=round_filters(32, width_coefficient,
-                              depth_divisor, min_depth),
-        kernel_size=[3, 3],
-        strides=[2, 2],
-        kernel_initializer=EfficientNetConvInitializer(),
-        padding='same',
-        use_bias=False)(x)
-    x = layers.BatchNormalization(
-        axis=channel_axis,
-        momentum=batch_norm_momentum,
-        epsilon=batch_norm_epsilon)(x)
-    x = Swish()(x)
-
-    num_blocks = sum([block_args.num_repeat for block_args in block_args_list])
-    drop_connect_rate_per_block = drop_connect_rate / float(num_blocks)
-
-    # Blocks part
-    for block_idx, block_args in enumerate(block_args_list):
-        assert block_args.num_repeat > 0
-
-        # Update block input and output filters based on depth multiplier.
-        block_args.input_filters = round_filters(block_args.input_filters, width_coefficient, depth_divisor, min_depth)
-        block_args.output_filters = round_filters(block_args.output_filters, width_coefficient, depth_divisor, min_depth)
-        block_args.num_repeat = round_repeats(block_args.num_repeat, depth_coefficient)
-
-        # The first block needs to take care of stride and filter size increase.
-        x = MBConvBlock(block_args.input_filters, block_args.output_filters,
-                        block_args.kernel_size, block_args.strides,
-                        block_args.expand_ratio, block_args.se_ratio,
-                        block_args.identity_skip, drop_connect_rate_per_block * block_idx,
-                        batch_norm_momentum, batch_norm_epsilon, data_format)(x)
-
-        if block_args.num_repeat > 1:
-            block_args.input_filters = block_args.output_filters
-            block_args.strides = [1, 1]
-
-        for _ in range(block_args.num_repeat - 1):
-            x = MBConvBlock(block_args.input_filters, block_args.output_filters,
-                            block_args.kernel_size, block_args.strides,
-                            block_args.expand_ratio, block_args.se_ratio,
-                            block_args.identity_skip, drop_connect_rate_per_block * block_idx,
-                            batch_norm_momentum, batch_norm_epsilon, data_format)(x)
-
-    # Head part
-    x = layers.Conv2D(
-        filters=round_filters(1280, width_coefficient, depth_coefficient, min_depth),
-        kernel_size=[1, 1],
-        strides=[1, 1],
-        kernel_initializer=EfficientNetConvInitializer(),
-        padding='same',
-        use_bias=False)(x)
-    x = layers.BatchNormalization(
-        axis=channel_axis,
-        momentum=batch_norm_momentum,
-        epsilon=batch_norm_epsilon)(x)
-    x = Swish()(x)
-
-    if include_top:
-        x = layers.GlobalAveragePooling2D(data_format=data_format)(x)
-
-        if dropout_rate > 0:
-            x = layers.Dropout(dropout_rate)(x)
-
-        x = layers.Dense(classes, kernel_initializer=EfficientNetDenseInitializer())(x)
-        x = layers.Activation('softmax')(x)
+            if not K.is_keras_tensor(input_tensor):
+                inputs = layers.Input(tensor=input_tensor, shape=input_shape)
+            else:
+                inputs = input_tensor
 
-    else:
-        if pooling == 'avg':
-            x = layers.GlobalAveragePooling2D()(x)
-        elif pooling == 'max':
-            x = layers.GlobalMaxPooling2D()(x)
+        x = inputs
+        x = layers.Conv2D(
+            filters=round_filters(32, width_coefficient,
+                                  depth_divisor, min_depth),
+            kernel_size=[3, 3],
+            strides=[2, 2],
+            kernel_initializer=_CONV_INITIALIZER,
+            padding='same',
+            data_format=data_format,
+            use_bias=False)(x)
+        x = layers.BatchNormalization(
+            axis=channel_axis,
+            momentum=batch_norm_momentum,
+            epsilon=batch_norm_epsilon)(x)
+        x = Swish()(x)
+
+        num_blocks = sum([block_args.num_repeat for block_args in block_args_list])
+        drop_connect_rate_per_block = drop_connect_rate / float(num_blocks)
+
+        # Blocks part
+        blocks = []
+        for block_idx, block_args in enumerate(block_args_list):
+            assert block_args.num_repeat > 0
+
+            # Update block input and output filters based on depth multiplier.
+            # The BlockArgs are left untouched, so that they can be reused to
+            # build other models.
+            input_filters = round_filters(block_args.input_filters, width_coefficient, depth_divisor, min_depth)
+            output_filters = round_filters(block_args.output_filters, width_coefficient, depth_divisor, min_depth)
+            num_repeat = round_repeats(block_args.num_repeat, depth_coefficient)
+            block_drop_connect_rate = drop_connect_rate_per_block * block_idx
+
+            # The first block needs to take care of stride and filter size increase.
+            blocks.append(MBConvBlock(input_filters, output_filters,
+                                      block_args.kernel_size, block_args.strides,
+                                      block_args.expand_ratio, block_args.se_ratio,
+                                      block_args.identity_skip, block_drop_connect_rate,
+                                      channel_axis,
+                                      batch_norm_momentum, batch_norm_epsilon,
+                                      fuse_depthwise))
+
+            # All the repeated blocks share the same arguments.
+            repeat_args = (output_filters, output_filters,
+                           block_args.kernel_size, [1, 1],
+                           block_args.expand_ratio, block_args.se_ratio,
+                           block_args.identity_skip, block_drop_connect_rate,
+                           channel_axis,
+                           batch_norm_momentum, batch_norm_epsilon,
+                           fuse_depthwise)
+
+            for _ in range(num_repeat - 1):
+                blocks.append(MBConvBlock(*repeat_args))
+
+        for block in blocks:
+            x = block(x)
+
+        # Head part
+        x = layers.Conv2D(
+            filters=round_filters(1280, width_coefficient, depth_coefficient, min_depth),
+            kernel_size=[1, 1],
+            strides=[1, 1],
+            kernel_initializer=_CONV_INITIALIZER,
+            padding='same',
+            data_format=data_format,
+            use_bias=False)(x)
+        x = layers.BatchNormalization(
+            axis=channel_axis,
+            momentum=batch_norm_momentum,
+            epsilon=batch_norm_epsilon)(x)
+        x = Swish()(x)
+
+        if include_top:
+            x = layers.GlobalAveragePooling2D(data_format=data_format)(x)
+
+            if dropout_rate > 0:
+                x = layers.Dropout(dropout_rate)(x)
 
-    outputs = x
+            x = layers.Dense(classes, kernel_initializer=_DENSE_INITIALIZER)(x)
+            # keep the softmax in float32 for numerical stability
+            x = layers.Activation('softmax', dtype='float32')(x)
+
+        else:
+            if pooling == 'avg':
+                x = layers.GlobalAveragePooling2D(data_format=data_format)(x)
+            elif pooling == 'max':
+                x = layers.GlobalMaxPooling2D(data_format=data_format)(x)
 
-    # Ensure that the model takes into account
-    # any potential predecessors of `input_tensor`.
-    if input_tensor is not None:
-        inputs = get_source_inputs(input_tensor)
+        outputs = x
 
-    model = Model(inputs, outputs)
+        # Ensure that the model takes into account
+        # any potential predecessors of `input_tensor`.
+        if input_tensor is not None:
+            inputs = get_source_inputs(input_tensor)
+
+        model = Model(inputs, outputs)
 
     # Load weights
     if weights == 'imagenet':
-        if default_size == 224:
-            if include_top:
-                weights_path = get_file(
-                    'efficientnet-b0.h5',
-                    "https://github.com/titu1994/keras-efficientnets/releases/download/v0.1/efficientnet-b0.h5",
-                    cache_subdir='models')
-            else:
-                weights_path = get_file(
-                    'efficientnet-b0_notop.h5',
-                    "https://github.com/titu1994/keras-efficientnets/releases/download/v0.1/efficientnet-b0_notop.h5",
-                    cache_subdir='models')
-            model.load_weights(weights_path)
-
-        elif default_size == 240:
-            if include_top:
-                weights_path = get_file(
-                    'efficientnet-b1.h5',
-                    "https://github.com/titu1994/keras-efficientnets/releases/download/v0.1/efficientnet-b1.h5",
-                    cache_subdir='models')
-            else:
-                weights_path = get_file(
-                    'efficientnet-b1_notop.h5',
-                    "https://github.com/titu1994/keras-efficientnets/releases/download/v0.1/efficientnet-b1_notop.h5",
-                    cache_subdir='models')
-            model.load_weights(weights_path)
-
-        elif default_size == 260:
-            if include_top:
-                weights_path = get_file(
-                    'efficientnet-b2.h5',
-                    "https://github.com/titu1994/keras-efficientnets/releases/download/v0.1/efficientnet-b2.h5",
-                    cache_subdir='models')
-            else:
-                weights_path = get_file(
-                    'efficientnet-b2_notop.h5',
-                    "https://github.com/titu1994/keras-efficientnets/releases/download/v0.1/efficientnet-b2_notop.h5",
-                    cache_subdir='models')
-            model.load_weights(weights_path)
-
-        elif default_size == 300:
-            if include_top:
-                weights_path = get_file(
-                    'efficientnet-b3.h5',
-                    "https://github.com/titu1994/keras-efficientnets/releases/download/v0.1/efficientnet-b3.h5",
-                    cache_subdir='models')
-            else:
-                weights_path = get_file(
-                    'efficientnet-b3_notop.h5',
-                    "https://github.com/titu1994/keras-efficientnets/releases/download/v0.1/efficientnet-b3_notop.h5",
-                    cache_subdir='models')
-            model.load_weights(weights_path)
-
-        elif default_size == 380:
-            if include_top:
-                weights_path = get_file(
-                    'efficientnet-b4.h5',
-                    "https://github.com/titu1994/keras-efficientnets/releases/download/v0.1/efficientnet-b4.h5",
-                    cache_subdir='models')
-            else:
-                weights_path = get_file(
-                    'efficientnet-b4_notop.h5',
-                    "https://github.com/titu1994/keras-efficientnets/releases/download/v0.1/efficientnet-b4_notop.h5",
-                    cache_subdir='models')
-            model.load_weights(weights_path)
-
-        elif default_size == 456:
-            if include_top:
-                weights_path = get_file(
-                    'efficientnet-b5.h5',
-                    "https://github.com/titu1994/keras-efficientnets/releases/download/v0.1/efficientnet-b5.h5",
-                    cache_subdir='models')
-            else:
-                weights_path = get_file(
-                    'efficientnet-b5_notop.h5',
-                    "https://github.com/titu1994/keras-efficientnets/releases/download/v0.1/efficientnet-b5_notop.h5",
-                    cache_subdir='models')
-            model.load_weights(weights_path)
-
-        # TODO: When weights for efficientnet-b6 and efficientnet-b7 becomes available, uncomment this section and update 
-        #           the ValueError message below (line 537: ValueError('ImageNet weights can only be loaded with EfficientNetB0-5'))
-        # elif default_size == 528:
-        #     if include_top:
-        #         weights_path = get_file(
-        #             'efficientnet-b6.h5',
-        #             "https://github.com/titu1994/keras-efficientnets/releases/download/v0.1/efficientnet-b6.h5",
-        #             cache_subdir='models')
-        #     else:
-        #         weights_path = get_file(
-        #             'efficientnet-b6_notop.h5',
-        #             "https://github.com/titu1994/keras-efficientnets/releases/download/v0.1/efficientnet-b6_notop.h5",
-        #             cache_subdir='models')
-        #     model.load_weights(weights_path)
-        #
-        # elif default_size == 600:
-        #     if include_top:
-        #         weights_path = get_file(
-        #             'efficientnet-b7.h5',
-        #             "https://github.com/titu1994/keras-efficientnets/releases/download/v0.1/efficientnet-b7.h5",
-        #             cache_subdir='models')
-        #     else:
-        #         weights_path = get_file(
-        #             'efficientnet-b7_notop.h5',
-        #             "https://github.com/titu1994/keras-efficientnets/releases/download/v0.1/efficientnet-b7_notop.h5",
-        #             cache_subdir='models')
-        #     model.load_weights(weights_path)
-
-        else:
+        if default_size not in _IMAGENET_WEIGHTS:
             raise ValueError('ImageNet weights can only be loaded with EfficientNetB0-5')
 
+        weights_path = _get_imagenet_weights_path(default_size, include_top)
+        model.load_weights(weights_path)
+
     elif weights is not None:
         model.load_weights(weights)
 
+    if fuse_batch_norm:
+        model = fuse_bn_for_inference(model)
+
+    if xla_compile:
+        model = compile_xla(model, input_signature=xla_input_signature)
+
+    if predict_batch_size is not None:
+        freeze_input_signature(model, batch_size=predict_batch_size)
+
     return model
 
 
@@ -551,7 +719,13 @@ def EfficientNetB0(input_shape=None,
                    classes=1000,
                    dropout_rate=0.2,
                    drop_connect_rate=0.,
-                   data_format=None):
+                   data_format=None,
+                   precision='float32',
+                   fuse_depthwise=False,
+                   fuse_batch_norm=False,
+                   xla_compile=False,
+                   xla_input_signature=None,
+                   predict_batch_size=None):
     """
     Builds EfficientNet B0.
 
@@ -589,11 +763,37 @@ def EfficientNetB0(input_shape=None,
             connections.
         data_format: "channels_first" or "channels_last". If left
             as None, defaults to the value set in ~/.keras.
+        precision: "float32" or "mixed_float16". Mixed precision
+            computes the convolutions in float16 on Tensor Cores,
+            and requires the "channels_last" data format.
+        fuse_depthwise: Whether to compile the Swish activation and the
+            depthwise convolution of every MBConvBlock as a single
+            XLA cluster. Only applies to models built in graph mode.
+        fuse_batch_norm: Whether to fold the BatchNormalization layers
+            into the preceding convolutions after the weights are
+            loaded. The resulting model can only be used for inference.
+        xla_compile: Whether to compile the inference forward pass
+            of the model with XLA. Requires TensorFlow 2.x.
+        xla_input_signature: Optional list with a single
+            `tf.TensorSpec` to fix the input shape of the XLA
+            compiled forward pass. Only used if `xla_compile`
+            is True.
+        predict_batch_size: Optional int. If provided, an XLA compiled
+            inference function with the input shape fixed to this
+            batch size is attached to the model as `model.predict_fn`.
+            Requires TensorFlow 2.x.
 
     # Raises:
         - ValueError: If weights are not in 'imagenet' or None.
         - ValueError: If weights are 'imagenet' and `classes` is
             not 1000.
+        - ValueError: If precision is not in 'float32' or
+            'mixed_float16'.
+        - ValueError: If precision is 'mixed_float16' and the
+            data format is 'channels_first', or Keras is not backed
+            by `tf.keras`.
+        - ValueError: If `fuse_depthwise` is True while Tensorflow
+            executes eagerly.
 
     # Returns:
         A Keras Model.
@@ -610,6 +810,12 @@ def EfficientNetB0(input_shape=None,
                         dropout_rate=dropout_rate,
                         drop_connect_rate=drop_connect_rate,
                         data_format=data_format,
+                        precision=precision,
+                        fuse_depthwise=fuse_depthwise,
+                        fuse_batch_norm=fuse_batch_norm,
+                        xla_compile=xla_compile,
+                        xla_input_signature=xla_input_signature,
+                        predict_batch_size=predict_batch_size,
                         default_size=224)
 
 
@@ -621,7 +827,13 @@ def EfficientNetB1(input_shape=None,
                    classes=1000,
                    dropout_rate=0.2,
                    drop_connect_rate=0.,
-                   data_format=None):
+                   data_format=None,
+                   precision='float32',
+                   fuse_depthwise=False,
+                   fuse_batch_norm=False,
+                   xla_compile=False,
+                   xla_input_signature=None,
+                   predict_batch_size=None):
     """
     Builds EfficientNet B1.
 
@@ -659,11 +871,37 @@ def EfficientNetB1(input_shape=None,
             connections.
         data_format: "channels_first" or "channels_last". If left
             as None, defaults to the value set in ~/.keras.
+        precision: "float32" or "mixed_float16". Mixed precision
+            computes the convolutions in float16 on Tensor Cores,
+            and requires the "channels_last" data format.
+        fuse_depthwise: Whether to compile the Swish activation and the
+            depthwise convolution of every MBConvBlock as a single
+            XLA cluster. Only applies to models built in graph mode.
+        fuse_batch_norm: Whether to fold the BatchNormalization layers
+            into the preceding convolutions after the weights are
+            loaded. The resulting model can only be used for inference.
+        xla_compile: Whether to compile the inference forward pass
+            of the model with XLA. Requires TensorFlow 2.x.
+        xla_input_signature: Optional list with a single
+            `tf.TensorSpec` to fix the input shape of the XLA
+            compiled forward pass. Only used if `xla_compile`
+            is True.
+        predict_batch_size: Optional int. If provided, an XLA compiled
+            inference function with the input shape fixed to this
+            batch size is attached to the model as `model.predict_fn`.
+            Requires TensorFlow 2.x.
 
     # Raises:
         - ValueError: If weights are not in 'imagenet' or None.
         - ValueError: If weights are 'imagenet' and `classes` is
             not 1000.
+        - ValueError: If precision is not in 'float32' or
+            'mixed_float16'.
+        - ValueError: If precision is 'mixed_float16' and the
+            data format is 'channels_first', or Keras is not backed
+            by `tf.keras`.
+        - ValueError: If `fuse_depthwise` is True while Tensorflow
+            executes eagerly.
 
     # Returns:
         A Keras Model.
@@ -680,6 +918,12 @@ def EfficientNetB1(input_shape=None,
                         dropout_rate=dropout_rate,
                         drop_connect_rate=drop_connect_rate,
                         data_format=data_format,
+                        precision=precision,
+                        fuse_depthwise=fuse_depthwise,
+                        fuse_batch_norm=fuse_batch_norm,
+                        xla_compile=xla_compile,
+                        xla_input_signature=xla_input_signature,
+                        predict_batch_size=predict_batch_size,
                         default_size=240)
 
 
@@ -691,7 +935,13 @@ def EfficientNetB2(input_shape=None,
                    classes=1000,
                    dropout_rate=0.3,
                    drop_connect_rate=0.,
-                   data_format=None):
+                   data_format=None,
+                   precision='float32',
+                   fuse_depthwise=False,
+                   fuse_batch_norm=False,
+                   xla_compile=False,
+                   xla_input_signature=None,
+                   predict_batch_size=None):
     """
     Builds EfficientNet B2.
 
@@ -729,11 +979,37 @@ def EfficientNetB2(input_shape=None,
             connections.
         data_format: "channels_first" or "channels_last". If left
             as None, defaults to the value set in ~/.keras.
+        precision: "float32" or "mixed_float16". Mixed precision
+            computes the convolutions in float16 on Tensor Cores,
+            and requires the "channels_last" data format.
+        fuse_depthwise: Whether to compile the Swish activation and the
+            depthwise convolution of every MBConvBlock as a single
+            XLA cluster. Only applies to models built in graph mode.
+        fuse_batch_norm: Whether to fold the BatchNormalization layers
+            into the preceding convolutions after the weights are
+            loaded. The resulting model can only be used for inference.
+        xla_compile: Whether to compile the inference forward pass
+            of the model with XLA. Requires TensorFlow 2.x.
+        xla_input_signature: Optional list with a single
+            `tf.TensorSpec` to fix the input shape of the XLA
+            compiled forward pass. Only used if `xla_compile`
+            is True.
+        predict_batch_size: Optional int. If provided, an XLA compiled
+            inference function with the input shape fixed to this
+            batch size is attached to the model as `model.predict_fn`.
+            Requires TensorFlow 2.x.
 
     # Raises:
         - ValueError: If weights are not in 'imagenet' or None.
         - ValueError: If weights are 'imagenet' and `classes` is
             not 1000.
+        - ValueError: If precision is not in 'float32' or
+            'mixed_float16'.
+        - ValueError: If precision is 'mixed_float16' and the
+            data format is 'channels_first', or Keras is not backed
+            by `tf.keras`.
+        - ValueError: If `fuse_depthwise` is True while Tensorflow
+            executes eagerly.
 
     # Returns:
         A Keras Model.
@@ -750,6 +1026,12 @@ def EfficientNetB2(input_shape=None,
                         dropout_rate=dropout_rate,
                         drop_connect_rate=drop_connect_rate,
                         data_format=data_format,
+                        precision=precision,
+                        fuse_depthwise=fuse_depthwise,
+                        fuse_batch_norm=fuse_batch_norm,
+                        xla_compile=xla_compile,
+                        xla_input_signature=xla_input_signature,
+                        predict_batch_size=predict_batch_size,
                         default_size=260)
 
 
@@ -761,7 +1043,13 @@ def EfficientNetB3(input_shape=None,
                    classes=1000,
                    dropout_rate=0.3,
                    drop_connect_rate=0.,
-                   data_format=None):
+                   data_format=None,
+                   precision='float32',
+                   fuse_depthwise=False,
+                   fuse_batch_norm=False,
+                   xla_compile=False,
+                   xla_input_signature=None,
+                   predict_batch_size=None):
     """
     Builds EfficientNet B3.
 
@@ -799,11 +1087,37 @@ def EfficientNetB3(input_shape=None,
             connections.
         data_format: "channels_first" or "channels_last". If left
             as None, defaults to the value set in ~/.keras.
+        precision: "float32" or "mixed_float16". Mixed precision
+            computes the convolutions in float16 on Tensor Cores,
+            and requires the "channels_last" data format.
+        fuse_depthwise: Whether to compile the Swish activation and the
+            depthwise convolution of every MBConvBlock as a single
+            XLA cluster. Only applies to models built in graph mode.
+        fuse_batch_norm: Whether to fold the BatchNormalization layers
+            into the preceding convolutions after the weights are
+            loaded. The resulting model can only be used for inference.
+        xla_compile: Whether to compile the inference forward pass
+            of the model with XLA. Requires TensorFlow 2.x.
+        xla_input_signature: Optional list with a single
+            `tf.TensorSpec` to fix the input shape of the XLA
+            compiled forward pass. Only used if `xla_compile`
+            is True.
+        predict_batch_size: Optional int. If provided, an XLA compiled
+            inference function with the input shape fixed to this
+            batch size is attached to the model as `model.predict_fn`.
+            Requires TensorFlow 2.x.
 
     # Raises:
         - ValueError: If weights are not in 'imagenet' or None.
         - ValueError: If weights are 'imagenet' and `classes` is
             not 1000.
+        - ValueError: If precision is not in 'float32' or
+            'mixed_float16'.
+        - ValueError: If precision is 'mixed_float16' and the
+            data format is 'channels_first', or Keras is not backed
+            by `tf.keras`.
+        - ValueError: If `fuse_depthwise` is True while Tensorflow
+            executes eagerly.
 
     # Returns:
         A Keras Model.
@@ -820,6 +1134,12 @@ def EfficientNetB3(input_shape=None,
                         dropout_rate=dropout_rate,
                         drop_connect_rate=drop_connect_rate,
                         data_format=data_format,
+                        precision=precision,
+                        fuse_depthwise=fuse_depthwise,
+                        fuse_batch_norm=fuse_batch_norm,
+                        xla_compile=xla_compile,
+                        xla_input_signature=xla_input_signature,
+                        predict_batch_size=predict_batch_size,
                         default_size=300)
 
 
@@ -831,7 +1151,13 @@ def EfficientNetB4(input_shape=None,
                    classes=1000,
                    dropout_rate=0.4,
                    drop_connect_rate=0.,
-                   data_format=None):
+                   data_format=None,
+                   precision='float32',
+                   fuse_depthwise=False,
+                   fuse_batch_norm=False,
+                   xla_compile=False,
+                   xla_input_signature=None,
+                   predict_batch_size=None):
     """
     Builds EfficientNet B4.
 
@@ -869,11 +1195,37 @@ def EfficientNetB4(input_shape=None,
             connections.
         data_format: "channels_first" or "channels_last". If left
             as None, defaults to the value set in ~/.keras.
+        precision: "float32" or "mixed_float16". Mixed precision
+            computes the convolutions in float16 on Tensor Cores,
+            and requires the "channels_last" data format.
+        fuse_depthwise: Whether to compile the Swish activation and the
+            depthwise convolution of every MBConvBlock as a single
+            XLA cluster. Only applies to models built in graph mode.
+        fuse_batch_norm: Whether to fold the BatchNormalization layers
+            into the preceding convolutions after the weights are
+            loaded. The resulting model can only be used for inference.
+        xla_compile: Whether to compile the inference forward pass
+            of the model with XLA. Requires TensorFlow 2.x.
+        xla_input_signature: Optional list with a single
+            `tf.TensorSpec` to fix the input shape of the XLA
+            compiled forward pass. Only used if `xla_compile`
+            is True.
+        predict_batch_size: Optional int. If provided, an XLA compiled
+            inference function with the input shape fixed to this
+            batch size is attached to the model as `model.predict_fn`.
+            Requires TensorFlow 2.x.
 
     # Raises:
         - ValueError: If weights are not in 'imagenet' or None.
         - ValueError: If weights are 'imagenet' and `classes` is
             not 1000.
+        - ValueError: If precision is not in 'float32' or
+            'mixed_float16'.
+        - ValueError: If precision is 'mixed_float16' and the
+            data format is 'channels_first', or Keras is not backed
+            by `tf.keras`.
+        - ValueError: If `fuse_depthwise` is True while Tensorflow
+            executes eagerly.
 
     # Returns:
         A Keras Model.
@@ -890,6 +1242,12 @@ def EfficientNetB4(input_shape=None,
                         dropout_rate=dropout_rate,
                         drop_connect_rate=drop_connect_rate,
                         data_format=data_format,
+                        precision=precision,
+                        fuse_depthwise=fuse_depthwise,
+                        fuse_batch_norm=fuse_batch_norm,
+                        xla_compile=xla_compile,
+                        xla_input_signature=xla_input_signature,
+                        predict_batch_size=predict_batch_size,
                         default_size=380)
 
 
@@ -901,7 +1259,13 @@ def EfficientNetB5(input_shape=None,
                    classes=1000,
                    dropout_rate=0.4,
                    drop_connect_rate=0.,
-                   data_format=None):
+                   data_format=None,
+                   precision='float32',
+                   fuse_depthwise=False,
+                   fuse_batch_norm=False,
+                   xla_compile=False,
+                   xla_input_signature=None,
+                   predict_batch_size=None):
     """
     Builds EfficientNet B5.
 
@@ -939,11 +1303,37 @@ def EfficientNetB5(input_shape=None,
             connections.
         data_format: "channels_first" or "channels_last". If left
             as None, defaults to the value set in ~/.keras.
+        precision: "float32" or "mixed_float16". Mixed precision
+            computes the convolutions in float16 on Tensor Cores,
+            and requires the "channels_last" data format.
+        fuse_depthwise: Whether to compile the Swish activation and the
+            depthwise convolution of every MBConvBlock as a single
+            XLA cluster. Only applies to models built in graph mode.
+        fuse_batch_norm: Whether to fold the BatchNormalization layers
+            into the preceding convolutions after the weights are
+            loaded. The resulting model can only be used for inference.
+        xla_compile: Whether to compile the inference forward pass
+            of the model with XLA. Requires TensorFlow 2.x.
+        xla_input_signature: Optional list with a single
+            `tf.TensorSpec` to fix the input shape of the XLA
+            compiled forward pass. Only used if `xla_compile`
+            is True.
+        predict_batch_size: Optional int. If provided, an XLA compiled
+            inference function with the input shape fixed to this
+            batch size is attached to the model as `model.predict_fn`.
+            Requires TensorFlow 2.x.
 
     # Raises:
         - ValueError: If weights are not in 'imagenet' or None.
         - ValueError: If weights are 'imagenet' and `classes` is
             not 1000.
+        - ValueError: If precision is not in 'float32' or
+            'mixed_float16'.
+        - ValueError: If precision is 'mixed_float16' and the
+            data format is 'channels_first', or Keras is not backed
+            by `tf.keras`.
+        - ValueError: If `fuse_depthwise` is True while Tensorflow
+            executes eagerly.
 
     # Returns:
         A Keras Model.
@@ -960,6 +1350,12 @@ def EfficientNetB5(input_shape=None,
                         dropout_rate=dropout_rate,
                         drop_connect_rate=drop_connect_rate,
                         data_format=data_format,
+                        precision=precision,
+                        fuse_depthwise=fuse_depthwise,
+                        fuse_batch_norm=fuse_batch_norm,
+                        xla_compile=xla_compile,
+                        xla_input_signature=xla_input_signature,
+                        predict_batch_size=predict_batch_size,
                         default_size=456)
 
 
@@ -971,7 +1367,13 @@ def EfficientNetB6(input_shape=None,
                    classes=1000,
                    dropout_rate=0.5,
                    drop_connect_rate=0.,
-                   data_format=None):
+                   data_format=None,
+                   precision='float32',
+                   fuse_depthwise=False,
+                   fuse_batch_norm=False,
+                   xla_compile=False,
+                   xla_input_signature=None,
+                   predict_batch_size=None):
     """
     Builds EfficientNet B6.
 
@@ -1009,11 +1411,37 @@ def EfficientNetB6(input_shape=None,
             connections.
         data_format: "channels_first" or "channels_last". If left
             as None, defaults to the value set in ~/.keras.
+        precision: "float32" or "mixed_float16". Mixed precision
+            computes the convolutions in float16 on Tensor Cores,
+            and requires the "channels_last" data format.
+        fuse_depthwise: Whether to compile the Swish activation and the
+            depthwise convolution of every MBConvBlock as a single
+            XLA cluster. Only applies to models built in graph mode.
+        fuse_batch_norm: Whether to fold the BatchNormalization layers
+            into the preceding convolutions after the weights are
+            loaded. The resulting model can only be used for inference.
+        xla_compile: Whether to compile the inference forward pass
+            of the model with XLA. Requires TensorFlow 2.x.
+        xla_input_signature: Optional list with a single
+            `tf.TensorSpec` to fix the input shape of the XLA
+            compiled forward pass. Only used if `xla_compile`
+            is True.
+        predict_batch_size: Optional int. If provided, an XLA compiled
+            inference function with the input shape fixed to this
+            batch size is attached to the model as `model.predict_fn`.
+            Requires TensorFlow 2.x.
 
     # Raises:
         - ValueError: If weights are not in 'imagenet' or None.
         - ValueError: If weights are 'imagenet' and `classes` is
             not 1000.
+        - ValueError: If precision is not in 'float32' or
+            'mixed_float16'.
+        - ValueError: If precision is 'mixed_float16' and the
+            data format is 'channels_first', or Keras is not backed
+            by `tf.keras`.
+        - ValueError: If `fuse_depthwise` is True while Tensorflow
+            executes eagerly.
 
     # Returns:
         A Keras Model.
@@ -1030,6 +1458,12 @@ def EfficientNetB6(input_shape=None,
                         dropout_rate=dropout_rate,
                         drop_connect_rate=drop_connect_rate,
                         data_format=data_format,
+                        precision=precision,
+                        fuse_depthwise=fuse_depthwise,
+                        fuse_batch_norm=fuse_batch_norm,
+                        xla_compile=xla_compile,
+                        xla_input_signature=xla_input_signature,
+                        predict_batch_size=predict_batch_size,
                         default_size=528)
 
 
@@ -1041,7 +1475,13 @@ def EfficientNetB7(input_shape=None,
                    classes=1000,
                    dropout_rate=0.5,
                    drop_connect_rate=0.,
-                   data_format=None):
+                   data_format=None,
+                   precision='float32',
+                   fuse_depthwise=False,
+                   fuse_batch_norm=False,
+                   xla_compile=False,
+                   xla_input_signature=None,
+                   predict_batch_size=None):
     """
     Builds EfficientNet B7.
 
@@ -1079,11 +1519,37 @@ def EfficientNetB7(input_shape=None,
             connections.
         data_format: "channels_first" or "channels_last". If left
             as None, defaults to the value set in ~/.keras.
+        precision: "float32" or "mixed_float16". Mixed precision
+            computes the convolutions in float16 on Tensor Cores,
+            and requires the "channels_last" data format.
+        fuse_depthwise: Whether to compile the Swish activation and the
+            depthwise convolution of every MBConvBlock as a single
+            XLA cluster. Only applies to models built in graph mode.
+        fuse_batch_norm: Whether to fold the BatchNormalization layers
+            into the preceding convolutions after the weights are
+            loaded. The resulting model can only be used for inference.
+        xla_compile: Whether to compile the inference forward pass
+            of the model with XLA. Requires TensorFlow 2.x.
+        xla_input_signature: Optional list with a single
+            `tf.TensorSpec` to fix the input shape of the XLA
+            compiled forward pass. Only used if `xla_compile`
+            is True.
+        predict_batch_size: Optional int. If provided, an XLA compiled
+            inference function with the input shape fixed to this
+            batch size is attached to the model as `model.predict_fn`.
+            Requires TensorFlow 2.x.
 
     # Raises:
         - ValueError: If weights are not in 'imagenet' or None.
         - ValueError: If weights are 'imagenet' and `classes` is
             not 1000.
+        - ValueError: If precision is not in 'float32' or
+            'mixed_float16'.
+        - ValueError: If precision is 'mixed_float16' and the
+            data format is 'channels_first', or Keras is not backed
+            by `tf.keras`.
+        - ValueError: If `fuse_depthwise` is True while Tensorflow
+            executes eagerly.
 
     # Returns:
         A Keras Model.
@@ -1100,6 +1566,12 @@ def EfficientNetB7(input_shape=None,
                         dropout_rate=dropout_rate,
                         drop_connect_rate=drop_connect_rate,
                         data_format=data_format,
+                        precision=precision,
+                        fuse_depthwise=fuse_depthwise,
+                        fuse_batch_norm=fuse_batch_norm,
+                        xla_compile=xla_compile,
+                        xla_input_signature=xla_input_signature,
+                        predict_batch_size=predict_batch_size,
                         default_size=600)
 
 
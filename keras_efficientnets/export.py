@@ -0,0 +1,212 @@
+import importlib.util
+import itertools
+import os
+import shutil
+import subprocess
+import sys
+import warnings
+
+import numpy as np
+import tensorflow as tf
+from keras import backend as K
+
+from keras_efficientnets.efficientnet import preprocess_input
+from keras_efficientnets.inference import fuse_bn_for_inference
+
+
+def get_representative_dataset(images, num_samples=200, data_format=None):
+    """
+    Builds a representative dataset to calibrate the quantization
+    ranges of a model, from a set of raw images.
+
+    # Arguments:
+        images: An iterable of images with pixel values in the
+            range [0, 255], such as a numpy array of shape
+            [N, H, W, C]. Each image must already be resized to
+            the input size of the model.
+        num_samples: Number of images to use for calibration.
+            Between 100 and 500 images is generally sufficient.
+        data_format: "channels_first" or "channels_last". If left
+            as None, defaults to the value set in ~/.keras.
+
+    # Returns:
+        A function which yields a single preprocessed image at
+        a time, with a leading batch axis.
+    """
+    def representative_dataset():
+        for image in itertools.islice(images, num_samples):
+            x = preprocess_input(np.array(image, dtype=np.float32), data_format)
+            yield [np.expand_dims(x, 0)]
+
+    return representative_dataset
+
+
+def _get_tflite_converter(model):
+    if isinstance(model, tf.keras.Model):
+        return tf.lite.TFLiteConverter.from_keras_model(model)
+
+    # multi-backend Keras builds the graph of the model inside its session
+    return tf.compat.v1.lite.TFLiteConverter.from_session(K.get_session(),
+                                                         model.inputs,
+                                                         model.outputs)
+
+
+def export_int8_tflite(model, representative_dataset, out_path, fuse_batch_norm=True):
+    """
+    Converts a model to a fully integer quantized TFLite model.
+
+    Post training quantization to int8 shrinks the weights 4x and
+    lets CPUs and edge accelerators run integer kernels, at a
+    small cost in accuracy.
+
+    # Arguments:
+        model: A Keras Model.
+        representative_dataset: A function yielding lists of
+            preprocessed input batches, used to calibrate the
+            quantization ranges. See `get_representative_dataset`.
+        out_path: Path where the .tflite model is written.
+        fuse_batch_norm: Whether to fold the BatchNormalization layers
+            into the preceding convolutions before quantization.
+            Quantizing the folded weights is considerably more
+            accurate than quantizing Conv and BatchNormalization
+            separately.
+
+    # Returns:
+        The serialized TFLite model, as bytes.
+    """
+    if fuse_batch_norm:
+        model = fuse_bn_for_inference(model)
+
+    converter = _get_tflite_converter(model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    converter.representative_dataset = tf.lite.RepresentativeDataset(representative_dataset)
+    converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+    converter.inference_input_type = tf.int8
+    converter.inference_output_type = tf.int8
+
+    tflite_model = converter.convert()
+
+    with open(out_path, 'wb') as f:
+        f.write(tflite_model)
+
+    return tflite_model
+
+
+def export_saved_model(model, export_dir):
+    """
+    Exports a model as a Tensorflow SavedModel.
+
+    If the model has a fixed shape `predict_fn`, attached by
+    `keras_efficientnets.inference.freeze_input_signature`, it is
+    exported as the serving signature of the SavedModel.
+
+    # Arguments:
+        model: A Keras Model.
+        export_dir: Directory where the SavedModel is written.
+
+    # Returns:
+        The export directory.
+    """
+    if isinstance(model, tf.keras.Model):
+        signatures = None
+        if hasattr(model, 'predict_fn'):
+            signatures = {'serving_default': model.predict_fn.get_concrete_function()}
+
+        tf.saved_model.save(model, export_dir, signatures=signatures)
+    else:
+        # multi-backend Keras builds the graph of the model inside its session
+        tf.compat.v1.saved_model.simple_save(K.get_session(), export_dir,
+                                             inputs={'input': model.input},
+                                             outputs={'output': model.output})
+
+    return export_dir
+
+
+def export_tensorrt(model, precision='FP16', calibration_cache=None, out='trt/', opset=13,
+                    fuse_batch_norm=True):
+    """
+    Builds a TensorRT engine from a model, through ONNX.
+
+    The model is exported as a SavedModel, converted to ONNX with
+    `tf2onnx`, and compiled into a serialized engine with `trtexec`.
+    TensorRT fuses Conv, BatchNorm and activations, and selects the
+    fastest FP16 or INT8 kernel per layer.
+
+    For FP16 Tensor Core kernels, build the model with the
+    "channels_last" data format.
+
+    Requires the `tf2onnx` library and the `trtexec` executable
+    of TensorRT to be available.
+
+    # Arguments:
+        model: A Keras Model.
+        precision: "FP16" or "INT8".
+        calibration_cache: Optional path to a TensorRT INT8
+            calibration cache. Without it, INT8 engines use
+            placeholder ranges, which are only useful to
+            benchmark the speed of the engine.
+        out: Directory where the SavedModel, the ONNX model and
+            the TensorRT engine are written.
+        opset: ONNX opset used for the conversion.
+        fuse_batch_norm: Whether to fold the BatchNormalization layers
+            into the preceding convolutions before the export, so
+            that TensorRT only sees plain convolutions.
+
+    # Raises:
+        - ValueError: If precision is not in 'FP16' or 'INT8'.
+        - ImportError: If `tf2onnx` is not installed.
+        - FileNotFoundError: If `trtexec` cannot be found.
+
+    # Returns:
+        The path to the serialized TensorRT engine.
+    """
+    if not isinstance(precision, str) or precision.upper() not in {'FP16', 'INT8'}:
+        raise ValueError('The `precision` argument should be either '
+                         '`FP16` or `INT8`.')
+
+    if importlib.util.find_spec('tf2onnx') is None:
+        raise ImportError('Exporting to TensorRT requires the `tf2onnx` library. '
+                          'Install it with `pip install tf2onnx`.')
+
+    trtexec = shutil.which('trtexec')
+    if trtexec is None:
+        raise FileNotFoundError('`trtexec` was not found. Make sure that '
+                                'TensorRT is installed and on the PATH.')
+
+    precision = precision.upper()
+
+    if fuse_batch_norm:
+        model = fuse_bn_for_inference(model)
+
+    if not os.path.exists(out):
+        os.makedirs(out)
+
+    saved_model_dir = os.path.join(out, 'saved_model')
+    onnx_path = os.path.join(out, 'model.onnx')
+    engine_path = os.path.join(out, 'model.engine')
+
+    # `simple_save` refuses to overwrite an existing SavedModel
+    if os.path.exists(saved_model_dir):
+        shutil.rmtree(saved_model_dir)
+
+    export_saved_model(model, saved_model_dir)
+
+    subprocess.check_call([sys.executable, '-m', 'tf2onnx.convert',
+                           '--saved-model', saved_model_dir,
+                           '--output', onnx_path,
+                           '--opset', str(opset)])
+
+    command = [trtexec, '--onnx=' + onnx_path, '--saveEngine=' + engine_path]
+    if precision == 'FP16':
+        command.append('--fp16')
+    else:
+        command.append('--int8')
+        if calibration_cache is not None:
+            command.append('--calib=' + calibration_cache)
+        else:
+            warnings.warn('No `calibration_cache` was provided, the INT8 engine '
+                          'uses placeholder ranges and will not be accurate.')
+
+    subprocess.check_call(command)
+
+    return engine_path
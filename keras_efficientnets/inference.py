@@ -0,0 +1,325 @@
+import contextlib
+import functools
+
+import numpy as np
+import tensorflow as tf
+from keras.models import Model
+
+
+def _check_eager_execution(name):
+    """Raises a ValueError if `tf.function` cannot be used eagerly."""
+    if not hasattr(tf, 'function') or not tf.executing_eagerly():
+        raise ValueError('`%s` requires TensorFlow 2.x with eager '
+                         'execution enabled.' % name)
+
+
+def _jit_function(fn, input_signature=None):
+    """Wraps `fn` in a `tf.function` which is compiled by XLA."""
+    try:
+        return tf.function(fn, input_signature=input_signature, jit_compile=True)
+    except TypeError:
+        pass
+
+    try:
+        # TF < 2.5 exposes the same flag as `experimental_compile`
+        return tf.function(fn, input_signature=input_signature, experimental_compile=True)
+    except TypeError:
+        raise ValueError('Compiling a `tf.function` with XLA requires '
+                         'TensorFlow 2.1 or later.')
+
+
+@contextlib.contextmanager
+def xla_scope(enabled=True):
+    """
+    Marks the ops created inside the scope to be compiled by XLA
+    as a single cluster.
+
+    This only applies to graphs built in graph mode, such as models
+    built by multi-backend Keras. In eager mode the scope does
+    nothing, use `compile_xla` instead.
+
+    # Arguments:
+        enabled: Whether the scope is active.
+    """
+    if not enabled or tf.executing_eagerly():
+        yield
+        return
+
+    with tf.xla.experimental.jit_scope():
+        yield
+
+
+class ForwardGraph(tf.Module):
+    """
+    Runs a list of prebuilt callables as a single XLA compiled function.
+
+    Tracing the whole forward pass into one function lets XLA form
+    clusters spanning entire MBConvBlocks (Conv 1x1 -> BN -> Swish ->
+    Depthwise Conv -> BN -> Swish -> SE -> Conv 1x1 -> BN), instead of
+    re-discovering fusion boundaries op by op at every call.
+
+    # Arguments:
+        callables: List of callables, which are applied in order
+            to the input. They must be built already.
+        input_signature: Optional list with a single `tf.TensorSpec`
+            fixing the input shape. If None, XLA re-compiles for
+            every new input shape.
+        name: Optional name of the module.
+    """
+
+    def __init__(self, callables, input_signature=None, name=None):
+        super(ForwardGraph, self).__init__(name=name)
+        self.callables = list(callables)
+        self.input_signature = input_signature
+        self._forward = _jit_function(self._run, input_signature)
+
+    def _run(self, x):
+        for fn in self.callables:
+            x = fn(x)
+        return x
+
+    def __call__(self, x):
+        return self._forward(x)
+
+    def get_concrete_function(self):
+        """Returns the traced function, which requires an `input_signature`."""
+        return self._forward.get_concrete_function()
+
+
+def compile_xla(model, input_signature=None, warmup=True):
+    """
+    Compiles the inference forward pass of a model with XLA.
+
+    XLA fuses the Conv -> BN -> Swish chains of every MBConvBlock
+    into a handful of kernels, which removes most of the kernel
+    launch overhead and memory traffic between the small 1x1 convs.
+
+    Only calls of the form `model(x)` with `training` unset or
+    `False` are compiled, training steps keep using the original
+    forward pass. Note that `model.predict` does not go through
+    `model.call` on every Keras version. To let XLA auto-cluster
+    any graph instead, use `tf.config.optimizer.set_jit(True)`.
+
+    Requires TensorFlow 2.x with eager execution enabled.
+
+    # Arguments:
+        model: A Keras Model.
+        input_signature: Optional list with a single `tf.TensorSpec`
+            fixing the input shape, such as
+            `[tf.TensorSpec([None, H, W, C], tf.float32)]`.
+            If None, XLA re-compiles for every new input shape.
+        warmup: Whether to run the compiled function once on a
+            zero tensor, so that the first real batch does not pay
+            the compilation cost.
+
+    # Raises:
+        - ValueError: If Tensorflow does not run eagerly, or does not
+            support XLA compiled functions.
+
+    # Returns:
+        The same model, with its `call` replaced. The compiled
+        forward pass is available as `model.forward_graph`.
+    """
+    _check_eager_execution('compile_xla')
+
+    original_call = model.call
+    forward = ForwardGraph([functools.partial(original_call, training=False)],
+                           input_signature,
+                           name='forward_graph')
+
+    def call(inputs, training=None, mask=None):
+        # symbolic learning phases are only resolved by the original call
+        if tf.is_tensor(training) or training:
+            return original_call(inputs, training=training, mask=mask)
+        return forward(inputs)
+
+    model.call = call
+    model.forward_graph = forward
+
+    if warmup:
+        if input_signature is not None:
+            shape = input_signature[0].shape.as_list()
+        else:
+            shape = list(model.input_shape)
+
+        shape[0] = shape[0] or 1
+        if all(dim is not None for dim in shape):
+            forward(tf.zeros(shape, dtype=tf.float32))
+
+    return model
+
+
+def freeze_input_signature(model, batch_size=1):
+    """
+    Attaches an XLA compiled inference function with a fixed input
+    shape to a model, as `model.predict_fn`.
+
+    XLA compiles a new executable for every input shape it sees.
+    Since inference usually runs on a constant batch shape, fixing
+    the signature avoids re-tracing and re-compiling. When the
+    model is exported with `keras_efficientnets.export.export_saved_model`,
+    `predict_fn` becomes its serving signature, so that serving
+    systems reuse a single compiled executable.
+
+    Requires TensorFlow 2.x with eager execution enabled.
+
+    # Arguments:
+        model: A Keras Model with a fully defined input shape.
+        batch_size: Batch size of the signature. If None, only
+            the image dimensions are fixed.
+
+    # Raises:
+        - ValueError: If Tensorflow does not run eagerly, or does not
+            support XLA compiled functions.
+
+    # Returns:
+        The `ForwardGraph` attached as `model.predict_fn`.
+    """
+    _check_eager_execution('freeze_input_signature')
+
+    input_shape = list(model.input_shape)
+    input_shape[0] = batch_size
+    input_signature = [tf.TensorSpec(input_shape, tf.float32)]
+
+    if hasattr(model, 'forward_graph'):
+        # `model.call` was replaced by `compile_xla`
+        callables = model.forward_graph.callables
+    else:
+        callables = [functools.partial(model.call, training=False)]
+
+    model.predict_fn = ForwardGraph(callables, input_signature, name='predict_fn')
+    return model.predict_fn
+
+
+def _replace_layer_names(structure, name_map):
+    """Replaces layer names inside the `inbound_nodes` of a layer config."""
+    if isinstance(structure, str):
+        return name_map.get(structure, structure)
+    if isinstance(structure, (list, tuple)):
+        return [_replace_layer_names(s, name_map) for s in structure]
+    return structure
+
+
+def _fold_batch_norm(conv_class, conv_weights, bn_config, bn_weights):
+    """Folds the statistics of a BatchNormalization into a conv kernel and bias."""
+    bn_weights = list(bn_weights)
+    gamma = bn_weights.pop(0) if bn_config.get('scale', True) else 1.
+    beta = bn_weights.pop(0) if bn_config.get('center', True) else 0.
+    moving_mean, moving_variance = bn_weights
+
+    scale = gamma / np.sqrt(moving_variance + bn_config['epsilon'])
+
+    kernel = conv_weights[0]
+    bias = conv_weights[1] if len(conv_weights) > 1 else 0.
+
+    if conv_class == 'DepthwiseConv2D':
+        # kernel is [kh, kw, in_channels, depth_multiplier]
+        kernel = kernel * scale.reshape(kernel.shape[2:])
+    else:
+        # kernel is [kh, kw, in_channels, out_channels]
+        kernel = kernel * scale
+
+    bias = (bias - moving_mean) * scale + beta
+    return [kernel, bias]
+
+
+def fuse_bn_for_inference(model):
+    """
+    Folds every BatchNormalization layer into the Conv2D or
+    DepthwiseConv2D layer that precedes it.
+
+    At inference time, a BatchNormalization is an affine transform
+    per channel, which can be absorbed into the weights of the
+    preceding convolution as
+    `W' = gamma / sqrt(var + eps) * W` and
+    `b' = gamma * (b - mean) / sqrt(var + eps) + beta`.
+    This removes one full read and write of the activation tensor
+    per BatchNormalization layer.
+
+    Only convolutions with a linear activation, whose output is
+    consumed exclusively by the BatchNormalization, are fused.
+
+    The fused model must only be used for inference, since the
+    batch statistics can no longer be updated.
+
+    # Arguments:
+        model: A functional Keras Model.
+
+    # Returns:
+        A new Keras Model without the fused BatchNormalization
+        layers, with weights copied from `model`. If no layer
+        can be fused, `model` itself is returned.
+    """
+    config = model.get_config()
+    layer_configs = {layer_config['name']: layer_config
+                     for layer_config in config['layers']}
+
+    # count the consumers of every layer output
+    consumers = {name: [] for name in layer_configs}
+    for layer_config in config['layers']:
+        for node in layer_config['inbound_nodes']:
+            for inbound in node:
+                consumers[inbound[0]].append(layer_config['name'])
+
+    for output in config['output_layers']:
+        consumers[output[0]].append(None)
+
+    fused = {}  # batch norm name -> conv name
+    for layer_config in config['layers']:
+        if layer_config['class_name'] != 'BatchNormalization':
+            continue
+
+        nodes = layer_config['inbound_nodes']
+        if len(nodes) != 1 or len(nodes[0]) != 1:
+            continue
+
+        conv_name = nodes[0][0][0]
+        conv_config = layer_configs[conv_name]
+        if conv_config['class_name'] not in ('Conv2D', 'DepthwiseConv2D'):
+            continue
+
+        if conv_config['config'].get('activation', 'linear') != 'linear':
+            continue
+
+        if len(conv_config['inbound_nodes']) != 1 or len(consumers[conv_name]) != 1:
+            continue
+
+        fused[layer_config['name']] = conv_name
+
+    if not fused:
+        return model
+
+    new_layers = []
+    for layer_config in config['layers']:
+        if layer_config['name'] in fused:
+            continue
+
+        layer_config = dict(layer_config)
+        layer_config['inbound_nodes'] = _replace_layer_names(layer_config['inbound_nodes'], fused)
+
+        if layer_config['name'] in fused.values():
+            layer_config['config'] = dict(layer_config['config'], use_bias=True)
+
+        new_layers.append(layer_config)
+
+    config['layers'] = new_layers
+    config['output_layers'] = _replace_layer_names(config['output_layers'], fused)
+
+    fused_model = Model.from_config(config)
+
+    folded_weights = {}
+    for bn_name, conv_name in fused.items():
+        bn_layer = model.get_layer(bn_name)
+        conv_layer = model.get_layer(conv_name)
+        folded_weights[conv_name] = _fold_batch_norm(layer_configs[conv_name]['class_name'],
+                                                     conv_layer.get_weights(),
+                                                     bn_layer.get_config(),
+                                                     bn_layer.get_weights())
+
+    for layer in fused_model.layers:
+        if layer.name in folded_weights:
+            layer.set_weights(folded_weights[layer.name])
+        elif layer.weights:
+            layer.set_weights(model.get_layer(layer.name).get_weights())
+
+    return fused_model
@@ -0,0 +1,151 @@
+import numpy as np
+import tensorflow as tf
+from keras import layers
+
+from keras_efficientnets.custom_objects import Swish, DropConnect
+
+try:
+    import tensorflow_model_optimization as tfmot
+    _tfmot_available = True
+except ImportError:
+    _tfmot_available = False
+
+
+# Layers which are quantized by the default 8 bit scheme of TFMOT.
+_QUANTIZABLE_LAYERS = (layers.Conv2D, layers.DepthwiseConv2D, layers.Dense,
+                       layers.BatchNormalization, layers.Add, layers.Multiply)
+
+# Layers whose kernels are ranked to select the layers fine tuned by EfQAT.
+_WEIGHTED_LAYERS = (layers.Conv2D, layers.DepthwiseConv2D, layers.Dense)
+
+
+if _tfmot_available:
+    class _OutputOnlyQuantizeConfig(tfmot.quantization.keras.QuantizeConfig):
+        """Base config for weightless layers, which are at most quantized at their output."""
+
+        def get_weights_and_quantizers(self, layer):
+            return []
+
+        def get_activations_and_quantizers(self, layer):
+            return []
+
+        def set_quantize_weights(self, layer, quantize_weights):
+            pass
+
+        def set_quantize_activations(self, layer, quantize_activations):
+            pass
+
+        def get_output_quantizers(self, layer):
+            return []
+
+        def get_config(self):
+            return {}
+
+    class SwishQuantizeConfig(_OutputOnlyQuantizeConfig):
+        """Quantizes the output of the weightless `Swish` layer."""
+
+        def get_output_quantizers(self, layer):
+            return [tfmot.quantization.keras.quantizers.MovingAverageQuantizer(
+                num_bits=8, per_axis=False, symmetric=False, narrow_range=False)]
+
+    class NoOpQuantizeConfig(_OutputOnlyQuantizeConfig):
+        """Leaves a layer, such as `DropConnect`, unquantized."""
+
+
+def _annotate_layer(layer):
+    quantize = tfmot.quantization.keras
+    layer = layer.__class__.from_config(layer.get_config())
+
+    if isinstance(layer, Swish):
+        return quantize.quantize_annotate_layer(layer, SwishQuantizeConfig())
+
+    if isinstance(layer, DropConnect):
+        return quantize.quantize_annotate_layer(layer, NoOpQuantizeConfig())
+
+    if isinstance(layer, _QUANTIZABLE_LAYERS):
+        return quantize.quantize_annotate_layer(layer)
+
+    return layer
+
+
+def get_critical_layers(model, top_k):
+    """
+    Ranks the convolutional and dense layers of a model by the
+    mean absolute value of their kernels, as in EfQAT.
+
+    # Arguments:
+        model: A Keras Model.
+        top_k: Number of layers to select.
+
+    # Returns:
+        The set of names of the `top_k` most critical layers.
+    """
+    scores = []
+    for layer in model.layers:
+        if isinstance(layer, _WEIGHTED_LAYERS):
+            kernel = layer.get_weights()[0]
+            scores.append((float(np.mean(np.abs(kernel))), layer.name))
+
+    scores = sorted(scores, reverse=True)
+    return set(name for _, name in scores[:top_k])
+
+
+def EfficientNetQAT(model, top_k=None):
+    """
+    Prepares an EfficientNet for Quantization Aware Training.
+
+    Inserts fake quantization nodes after the weights and activations
+    of the model, so that fine tuning learns to compensate for the
+    int8 quantization error through straight-through gradients.
+    The `Swish` activations are quantized at their output, while
+    `DropConnect` is left as is.
+
+    Requires `tensorflow_model_optimization`, and Keras to be backed
+    by `tf.keras` (Keras 2.4+).
+
+    # Arguments:
+        model: A Keras Model, usually with pretrained weights.
+        top_k: Optional int. If provided, only the `top_k` most
+            critical layers, as ranked by `get_critical_layers`,
+            are left trainable (EfQAT). This speeds up the fine
+            tuning considerably, for a small cost in accuracy.
+
+    # Raises:
+        - ImportError: If `tensorflow_model_optimization` is not
+            installed.
+        - ValueError: If the model is not a `tf.keras` model.
+
+    # Returns:
+        A quantization aware Keras Model, with weights copied
+        from `model`.
+    """
+    if not _tfmot_available:
+        raise ImportError('Quantization aware training requires the '
+                          '`tensorflow_model_optimization` library. Install it '
+                          'with `pip install tensorflow-model-optimization`.')
+
+    if not isinstance(model, tf.keras.Model):
+        raise ValueError('Quantization aware training requires Keras to be '
+                         'backed by `tf.keras` (Keras 2.4+).')
+
+    quantize = tfmot.quantization.keras
+
+    annotated_model = tf.keras.models.clone_model(model, clone_function=_annotate_layer)
+    annotated_model.set_weights(model.get_weights())
+
+    with quantize.quantize_scope({'SwishQuantizeConfig': SwishQuantizeConfig,
+                                  'NoOpQuantizeConfig': NoOpQuantizeConfig,
+                                  'Swish': Swish,
+                                  'DropConnect': DropConnect}):
+        qat_model = quantize.quantize_apply(annotated_model)
+
+    if top_k is not None:
+        critical_layers = get_critical_layers(model, top_k)
+
+        for layer in qat_model.layers:
+            # quantized layers are wrapped, the wrapped layer keeps the original name
+            name = getattr(layer, 'layer', layer).name
+            if layer.weights:
+                layer.trainable = name in critical_layers
+
+    return qat_model
@@ -0,0 +1,27 @@
+try:
+    import tensorflow as tf
+    from keras import layers
+except ImportError:
+    TF_KERAS = False
+else:
+    # Keras 2.4+ is a thin wrapper around tf.keras
+    TF_KERAS = issubclass(layers.Layer, tf.keras.layers.Layer)
+
+
+def get_block_args():
+    """Returns a new list of BlockArgs for a small, fast to build EfficientNet."""
+    import keras_efficientnets as KE
+
+    return [
+        KE.BlockArgs(32, 16, kernel_size=3, strides=(1, 1), num_repeat=1, se_ratio=0.25, expand_ratio=1),
+        KE.BlockArgs(16, 24, kernel_size=3, strides=(2, 2), num_repeat=2, se_ratio=0.25, expand_ratio=6),
+    ]
+
+
+def get_model(input_shape=(32, 32, 3), **kwargs):
+    """Builds a small EfficientNet with 10 classes and random weights."""
+    import keras_efficientnets as KE
+
+    kwargs.setdefault('weights', None)
+    kwargs.setdefault('classes', 10)
+    return KE.EfficientNet(input_shape, get_block_args(), 1.0, 1.0, **kwargs)
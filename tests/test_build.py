@@ -3,12 +3,16 @@ import os
 import numpy as np
 import pytest
 import six
+import tensorflow as tf
 from keras import backend as K
+from keras import layers
 from keras import utils
 from keras_applications.imagenet_utils import decode_predictions
+from keras_applications.imagenet_utils import preprocess_input as _preprocess
 from keras_preprocessing.image import img_to_array, load_img
 
 import keras_efficientnets as KE
+from conftest import TF_KERAS, get_block_args, get_model
 
 
 def reset_backend(func):
@@ -92,5 +96,173 @@ def test_efficientnet_b5():
     assert pred[0][0][1] == 'tiger_cat'
 
 
+@reset_backend
+def test_block_args_not_modified():
+    block_args_list = get_block_args()
+    encoded = [block.encode_block_string(block) for block in block_args_list]
+
+    model_1 = KE.EfficientNet((32, 32, 3), block_args_list, 1.4, 1.8, weights=None)
+    model_2 = KE.EfficientNet((32, 32, 3), block_args_list, 1.4, 1.8, weights=None)
+
+    assert [block.encode_block_string(block) for block in block_args_list] == encoded
+    assert model_1.count_params() == model_2.count_params()
+
+
+def test_round_filters_and_repeats():
+    from keras_efficientnets.efficientnet import round_filters, round_repeats
+
+    assert round_filters(32, 1.0, 8, None) == 32
+    assert round_filters(32, 1.4, 8, None) == 48
+    assert round_filters(1280, 1.6, 8, None) == 2048
+    # 180 * 1.4 is 251.99999999999997 in floating point
+    assert round_filters(180, 1.4, 8, None) == 256
+
+    assert round_repeats(3, 1.0) == 3
+    assert round_repeats(2, 1.1) == 3
+    # 10 * 1.1 is 11.000000000000002 in floating point
+    assert round_repeats(10, 1.1) == 11
+
+    # coefficients with more than one decimal are not truncated
+    assert round_filters(192, 1.1044, 8, None) == 216
+    assert round_filters(32, 0.0004, 8, None) == 8
+    assert round_repeats(3, 1.0001) == 4
+
+
+@pytest.mark.parametrize('data_format', ['channels_last', 'channels_first'])
+def test_preprocess_input(data_format):
+    if data_format == 'channels_first':
+        x = np.random.uniform(0, 255, size=(2, 3, 8, 8))
+    else:
+        x = np.random.uniform(0, 255, size=(2, 8, 8, 3))
+
+    expected = _preprocess(x.copy(), data_format, mode='torch', backend=K)
+
+    np.testing.assert_allclose(KE.preprocess_input(x.copy(), data_format),
+                               expected, rtol=1e-5, atol=1e-5)
+    np.testing.assert_allclose(KE.preprocess_input(x[0].copy(), data_format),
+                               expected[0], rtol=1e-5, atol=1e-5)
+
+    batch = K.eval(KE.preprocess_input_batch(x.astype('uint8'), data_format))
+    np.testing.assert_allclose(batch,
+                               _preprocess(x.astype('uint8').astype('float32'), data_format,
+                                           mode='torch', backend=K),
+                               rtol=1e-5, atol=1e-5)
+
+
+@reset_backend
+def test_se_block_squeeze():
+    from keras.models import Model
+    from keras_efficientnets.efficientnet import SEBlock
+
+    inputs = layers.Input(shape=(8, 8, 6))
+    block = SEBlock(6, se_ratio=0.25, expand_ratio=1, channel_axis=-1)
+    model = Model(inputs, block.reshape(block.pool(inputs)))
+
+    x = np.random.uniform(size=(2, 8, 8, 6))
+    np.testing.assert_allclose(model.predict(x),
+                               np.mean(x, axis=(1, 2), keepdims=True),
+                               rtol=1e-5, atol=1e-6)
+
+
+def test_drop_connect_inference_is_identity():
+    from keras_efficientnets.custom_objects import DropConnect
+
+    layer = DropConnect(0.5)
+    with tf.Graph().as_default() as graph:
+        x = tf.compat.v1.placeholder(tf.float32, [None, 4, 4, 3])
+        num_ops = len(graph.get_operations())
+
+        assert layer.call(x, training=False) is x
+        assert len(graph.get_operations()) == num_ops
+
+        layer(x, training=False)
+        op_types = [op.type for op in graph.get_operations()[num_ops:]]
+        assert not any(op_type.startswith('Random') for op_type in op_types)
+
+
+def test_drop_connect_training_masks_samples():
+    from keras_efficientnets.custom_objects import DropConnect
+
+    x = K.constant(np.ones((8, 4, 4, 3)))
+    output = K.eval(DropConnect(0.5).call(x, training=True))
+
+    # every sample is either dropped, or kept and scaled by 1 / keep_prob
+    for sample in output:
+        assert np.all(sample == 0.) or np.allclose(sample, 2.)
+
+
+@reset_backend
+def test_wrapper_forwards_inference_options():
+
+    model = KE.EfficientNetB0(weights=None, fuse_batch_norm=True)
+    assert not any(isinstance(layer, layers.BatchNormalization)
+                   for layer in model.layers)
+
+
+@reset_backend
+def test_channels_first():
+
+    model = get_model((3, 32, 32), include_top=False,
+                      data_format='channels_first')
+    assert model.output_shape == (None, 1280, 8, 8)
+
+    for layer in model.layers:
+        if isinstance(layer, (layers.Conv2D, layers.DepthwiseConv2D)):
+            assert layer.data_format == 'channels_first'
+
+    model = get_model((3, 32, 32), include_top=False, pooling='max',
+                      data_format='channels_first')
+    assert model.output_shape == (None, 1280)
+
+
+def test_mixed_precision_channels_first():
+    with pytest.raises(ValueError):
+        get_model((3, 32, 32), precision='mixed_float16',
+                  data_format='channels_first')
+
+
+@pytest.mark.skipif(TF_KERAS, reason='tf.keras backed Keras supports mixed precision')
+def test_mixed_precision_requires_tf_keras():
+    with pytest.raises(ValueError):
+        get_model(precision='mixed_float16')
+
+
+@pytest.mark.skipif(not TF_KERAS, reason='dtype policies require tf.keras backed Keras')
+@reset_backend
+def test_mixed_precision_is_scoped_to_the_build():
+
+    mixed_precision = tf.keras.mixed_precision
+    if hasattr(mixed_precision, 'global_policy'):
+        global_policy = mixed_precision.global_policy
+    else:
+        global_policy = mixed_precision.experimental.global_policy
+
+    model = get_model(precision='mixed_float16')
+    conv_outputs = [layer.output for layer in model.layers
+                    if isinstance(layer, layers.Conv2D)]
+    assert all(output.dtype == tf.float16 for output in conv_outputs)
+    assert model.output.dtype == tf.float32
+    assert global_policy().name == 'float32'
+
+    model = get_model()
+    conv_outputs = [layer.output for layer in model.layers
+                    if isinstance(layer, layers.Conv2D)]
+    assert all(output.dtype == tf.float32 for output in conv_outputs)
+
+
+@pytest.mark.skipif(not hasattr(tf.config.experimental, 'enable_tensor_float_32_execution'),
+                    reason='requires TensorFloat-32 support in Tensorflow')
+@reset_backend
+def test_float32_keeps_tensor_float_32_setting():
+    enabled = tf.config.experimental.tensor_float_32_execution_enabled()
+    tf.config.experimental.enable_tensor_float_32_execution(False)
+
+    try:
+        get_model()
+        assert not tf.config.experimental.tensor_float_32_execution_enabled()
+    finally:
+        tf.config.experimental.enable_tensor_float_32_execution(enabled)
+
+
 if __name__ == '__main__':
     pytest.main(__file__)
@@ -0,0 +1,60 @@
+import importlib.util
+import shutil
+
+import numpy as np
+import pytest
+
+tf = pytest.importorskip('tensorflow')
+
+from keras_efficientnets.export import export_int8_tflite, get_representative_dataset
+from keras_efficientnets.export import export_tensorrt
+from conftest import get_model
+
+
+def test_export_int8_tflite(tmp_path):
+    images = np.random.uniform(0, 255, size=(4, 32, 32, 3))
+    representative_dataset = get_representative_dataset(images, num_samples=4,
+                                                        data_format='channels_last')
+
+    out_path = str(tmp_path / 'model.tflite')
+    tflite_model = export_int8_tflite(get_model(data_format='channels_last'),
+                                     representative_dataset, out_path)
+    assert tflite_model
+
+    interpreter = tf.lite.Interpreter(model_path=out_path)
+    interpreter.allocate_tensors()
+    assert interpreter.get_input_details()[0]['dtype'] == np.int8
+    assert interpreter.get_output_details()[0]['dtype'] == np.int8
+
+    x = np.zeros(interpreter.get_input_details()[0]['shape'], dtype=np.int8)
+    interpreter.set_tensor(interpreter.get_input_details()[0]['index'], x)
+    interpreter.invoke()
+    output = interpreter.get_tensor(interpreter.get_output_details()[0]['index'])
+    assert output.shape == (1, 10)
+
+
+def test_export_tensorrt_precision():
+    with pytest.raises(ValueError):
+        export_tensorrt(None, precision='FP64')
+
+    with pytest.raises(ValueError):
+        export_tensorrt(None, precision=16)
+
+
+def test_export_tensorrt_requires_tf2onnx(monkeypatch):
+    monkeypatch.setattr(importlib.util, 'find_spec', lambda name: None)
+
+    with pytest.raises(ImportError):
+        export_tensorrt(None)
+
+
+def test_export_tensorrt_requires_trtexec(monkeypatch):
+    monkeypatch.setattr(importlib.util, 'find_spec', lambda name: object())
+    monkeypatch.setattr(shutil, 'which', lambda name: None)
+
+    with pytest.raises(FileNotFoundError):
+        export_tensorrt(None)
+
+
+if __name__ == '__main__':
+    pytest.main(__file__)
@@ -0,0 +1,129 @@
+import numpy as np
+import pytest
+import tensorflow as tf
+from keras import layers
+
+from keras_efficientnets import inference
+from conftest import TF_KERAS, get_model
+
+EAGER = hasattr(tf, 'function') and tf.executing_eagerly()
+
+requires_eager = pytest.mark.skipif(not EAGER, reason='requires TensorFlow 2.x')
+requires_tf_keras = pytest.mark.skipif(not (EAGER and TF_KERAS),
+                                       reason='requires TensorFlow 2.x and tf.keras backed Keras')
+
+
+def test_fuse_bn_for_inference():
+    model = get_model()
+
+    # give the batch norm layers non trivial statistics
+    for layer in model.layers:
+        if isinstance(layer, layers.BatchNormalization):
+            layer.set_weights([np.random.uniform(0.5, 1.5, size=w.shape)
+                               for w in layer.get_weights()])
+
+    fused_model = inference.fuse_bn_for_inference(model)
+    assert fused_model is not model
+    assert not any(isinstance(layer, layers.BatchNormalization)
+                   for layer in fused_model.layers)
+
+    x = np.random.uniform(size=(2, 32, 32, 3))
+    np.testing.assert_allclose(model.predict(x), fused_model.predict(x),
+                               rtol=1e-4, atol=1e-5)
+
+
+@requires_eager
+def test_forward_graph():
+    forward = inference.ForwardGraph([lambda x: x * 2., lambda x: x + 1.],
+                                     [tf.TensorSpec([None, 4], tf.float32)])
+
+    x = np.random.uniform(size=(3, 4)).astype('float32')
+    np.testing.assert_allclose(forward(x).numpy(), x * 2. + 1., rtol=1e-6)
+
+    concrete_function = forward.get_concrete_function()
+    np.testing.assert_allclose(concrete_function(tf.constant(x)).numpy(),
+                               x * 2. + 1., rtol=1e-6)
+
+
+@requires_tf_keras
+def test_compile_xla():
+    model = get_model()
+
+    x = np.random.uniform(size=(2, 32, 32, 3)).astype('float32')
+    expected = model.predict(x)
+
+    model = inference.compile_xla(model)
+    np.testing.assert_allclose(model(x).numpy(), expected, rtol=1e-4, atol=1e-5)
+    np.testing.assert_allclose(model(x, training=False).numpy(), expected, rtol=1e-4, atol=1e-5)
+
+
+@requires_tf_keras
+def test_compile_xla_training_uses_original_call(monkeypatch):
+    model = inference.compile_xla(get_model(), warmup=False)
+
+    calls = []
+    forward = model.forward_graph._forward
+    monkeypatch.setattr(model.forward_graph, '_forward',
+                        lambda x: calls.append(x) or forward(x))
+
+    x = np.random.uniform(size=(2, 32, 32, 3)).astype('float32')
+    model(x, training=True)
+    assert not calls
+
+    model(x)
+    assert len(calls) == 1
+
+
+@requires_tf_keras
+def test_predict_batch_size(tmp_path):
+    from keras_efficientnets.export import export_saved_model
+
+    model = get_model(predict_batch_size=2)
+    assert model.predict_fn.input_signature[0].shape.as_list() == [2, 32, 32, 3]
+
+    x = np.random.uniform(size=(2, 32, 32, 3)).astype('float32')
+    np.testing.assert_allclose(model.predict_fn(x).numpy(), model.predict(x),
+                               rtol=1e-4, atol=1e-5)
+
+    export_dir = export_saved_model(model, str(tmp_path / 'saved_model'))
+    signatures = tf.saved_model.load(export_dir).signatures
+    assert 'serving_default' in signatures
+
+    serving_input = signatures['serving_default'].structured_input_signature[1]
+    assert [spec.shape.as_list() for spec in serving_input.values()] == [[2, 32, 32, 3]]
+
+
+def test_xla_scope_in_graph_mode():
+    with tf.Graph().as_default():
+        x = tf.compat.v1.placeholder(tf.float32, [1, 8, 8, 3])
+        kernel = tf.ones([3, 3, 3, 1])
+
+        with inference.xla_scope():
+            fused = tf.nn.depthwise_conv2d(x, kernel, [1, 1, 1, 1], 'SAME')
+
+        unfused = tf.nn.depthwise_conv2d(x, kernel, [1, 1, 1, 1], 'SAME')
+
+    assert fused.op.get_attr('_XlaCompile')
+    with pytest.raises(ValueError):
+        unfused.op.get_attr('_XlaCompile')
+
+
+@pytest.mark.skipif(tf.executing_eagerly(), reason='functional models are built eagerly on TensorFlow 2.x')
+def test_fuse_depthwise():
+    model = get_model(fuse_depthwise=True)
+
+    depthwise_layers = [layer for layer in model.layers
+                        if isinstance(layer, layers.DepthwiseConv2D)]
+    assert depthwise_layers
+    for layer in depthwise_layers:
+        assert layer.output.op.get_attr('_XlaCompile')
+
+
+@requires_eager
+def test_fuse_depthwise_in_eager_mode():
+    with pytest.raises(ValueError):
+        get_model(fuse_depthwise=True)
+
+
+if __name__ == '__main__':
+    pytest.main(__file__)
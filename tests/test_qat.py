@@ -0,0 +1,44 @@
+import pytest
+
+tf = pytest.importorskip('tensorflow')
+pytest.importorskip('tensorflow_model_optimization')
+
+from keras import layers
+
+from keras_efficientnets.qat import EfficientNetQAT, get_critical_layers
+from conftest import TF_KERAS, get_model
+
+pytestmark = pytest.mark.skipif(not TF_KERAS, reason='requires tf.keras backed Keras')
+
+
+def get_weighted_layers(qat_model):
+    """Returns the wrapped conv and dense layers, with their wrappers."""
+    return [(layer, layer.layer) for layer in qat_model.layers
+            if isinstance(getattr(layer, 'layer', None),
+                          (layers.Conv2D, layers.DepthwiseConv2D, layers.Dense))]
+
+
+def test_efficientnet_qat():
+    model = get_model()
+    qat_model = EfficientNetQAT(model)
+
+    weighted_layers = get_weighted_layers(qat_model)
+    num_weighted_layers = sum(isinstance(layer, (layers.Conv2D, layers.DepthwiseConv2D, layers.Dense))
+                              for layer in model.layers)
+    assert len(weighted_layers) == num_weighted_layers
+    assert all(wrapper.trainable for wrapper, _ in weighted_layers)
+
+
+def test_efficientnet_qat_top_k():
+    model = get_model()
+    critical_layers = get_critical_layers(model, top_k=3)
+    assert len(critical_layers) == 3
+
+    qat_model = EfficientNetQAT(model, top_k=3)
+    trainable_layers = set(layer.name for wrapper, layer in get_weighted_layers(qat_model)
+                           if wrapper.trainable)
+    assert trainable_layers == critical_layers
+
+
+if __name__ == '__main__':
+    pytest.main(__file__)